@@ -37,6 +37,13 @@ async def lifespan(app: FastAPI):
         thread_name_prefix="ai_investment_worker"
     )
     logger.info(f"Initialized thread pool with {max_workers} workers")
+
+    # Process pool for truly CPU-bound work (indicator math, PDF
+    # generation) where threads would serialize on the GIL
+    app.state.process_pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=multiprocessing.cpu_count()
+    )
+    logger.info(f"Initialized process pool with {multiprocessing.cpu_count()} workers")
     
     # Check database connection
     if not check_db_connection():
@@ -80,6 +87,12 @@ async def lifespan(app: FastAPI):
         app.state.thread_pool.shutdown(wait=True)
         logger.info("Thread pool shutdown complete")
 
+    # Shutdown process pool
+    if hasattr(app.state, 'process_pool'):
+        logger.info("Shutting down process pool...")
+        app.state.process_pool.shutdown(wait=True)
+        logger.info("Process pool shutdown complete")
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Investment Tool",
@@ -90,6 +103,19 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Publish the executor in a ContextVar so thread-pool helpers can
+# dispatch without walking request.app.state per call (or without a
+# request object at all)
+from app.utils.threading import THREAD_POOL, PROCESS_POOL
+
+
+@app.middleware("http")
+async def _set_thread_pool_context(request: Request, call_next):
+    state = request.app.state
+    THREAD_POOL.set(getattr(state, 'thread_pool', None))
+    PROCESS_POOL.set(getattr(state, 'process_pool', None))
+    return await call_next(request)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
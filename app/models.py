@@ -194,7 +194,9 @@ class NewsArticle(Base):
     source_id = Column(String(50))
     author = Column(String(200))
     published_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    content_hash = Column(String(64), unique=True, index=True)  # For deduplication
+    # For deduplication; sized for legacy 64-char SHA-256 rows, new hashes
+    # are 32-char xxh3_128/blake2b digests
+    content_hash = Column(String(64), unique=True, index=True)
     
     # Additional metadata fields for enhanced functionality
     word_count = Column(Integer)
@@ -480,8 +480,10 @@ class NewsArticleCreate(NewsArticleBase):
     def validate_content_hash(cls, v):
         if not v or len(v.strip()) == 0:
             raise ValueError('Content hash cannot be empty')
-        if len(v) != 64:  # SHA-256 hash length
-            raise ValueError('Content hash must be 64 characters long')
+        # 32 chars for the xxh3_128/blake2b digests produced today, 64 for
+        # legacy SHA-256 hashes already stored in the database
+        if len(v) not in (32, 64):
+            raise ValueError('Content hash must be 32 or 64 characters long')
         return v.strip()
 
 class NewsArticleUpdate(BaseModel):
@@ -16,7 +16,7 @@ from .news_providers import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderHealth:
     """Health status of a news provider"""
     name: str
@@ -186,7 +186,8 @@ class NewsAPIGateway:
         # Yahoo Finance provider (no API key needed)
         self.providers['yahoo'] = YahooFinanceProvider()
         
-        self.logger.info(f"Initialized {len(self.providers)} news providers: {list(self.providers.keys())}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Initialized %d news providers: %s", len(self.providers), list(self.providers.keys()))
     
     def fetch_news(self, symbols: List[str], provider: str = None, limit: int = 50) -> List[NewsArticle]:
         """
@@ -210,7 +211,7 @@ class NewsAPIGateway:
                 articles = self._fetch_news_for_symbol(symbol, provider, limit)
                 all_articles.extend(articles)
             except Exception as e:
-                self.logger.error(f"Failed to fetch news for {symbol}: {e}")
+                self.logger.error("Failed to fetch news for %s: %s", symbol, e)
                 continue
         
         # Deduplicate articles
@@ -236,7 +237,7 @@ class NewsAPIGateway:
                 # Check rate limits
                 if not self.rate_limiter.can_make_request(provider_name):
                     wait_time = self.rate_limiter.get_wait_time(provider_name)
-                    self.logger.warning(f"Rate limited for {provider_name}, need to wait {wait_time}s")
+                    self.logger.warning("Rate limited for %s, need to wait %ss", provider_name, wait_time)
                     continue
                 
                 # Check provider health
@@ -255,11 +256,13 @@ class NewsAPIGateway:
                     provider_name, True, provider.get_rate_limit_status()
                 )
                 
-                self.logger.info(f"Successfully fetched {len(articles)} articles for {symbol} from {provider_name}")
+                # DEBUG with lazy %-formatting: this runs once per symbol, so skip
+                # string construction entirely when the level is disabled
+                self.logger.debug("Fetched %d articles for %s from %s", len(articles), symbol, provider_name)
                 return articles
-                
+
             except RateLimitExceededError as e:
-                self.logger.warning(f"Rate limit exceeded for {provider_name}: {e}")
+                self.logger.warning("Rate limit exceeded for %s: %s", provider_name, e)
                 self.fallback_manager.update_provider_health(
                     provider_name, False, provider.get_rate_limit_status()
                 )
@@ -267,7 +270,7 @@ class NewsAPIGateway:
                 continue
                 
             except NewsProviderError as e:
-                self.logger.error(f"Provider {provider_name} failed: {e}")
+                self.logger.error("Provider %s failed: %s", provider_name, e)
                 self.fallback_manager.update_provider_health(
                     provider_name, False, provider.get_rate_limit_status()
                 )
@@ -349,9 +352,9 @@ class NewsAPIGateway:
             try:
                 articles = self._fetch_news_for_symbol(symbol, force_provider, limit=100)
                 results[symbol] = articles
-                self.logger.info(f"Manual refresh: {len(articles)} articles for {symbol}")
+                self.logger.debug("Manual refresh: %d articles for %s", len(articles), symbol)
             except Exception as e:
-                self.logger.error(f"Manual refresh failed for {symbol}: {e}")
+                self.logger.error("Manual refresh failed for %s: %s", symbol, e)
                 results[symbol] = []
         
         return results
\ No newline at end of file
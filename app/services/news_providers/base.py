@@ -2,13 +2,126 @@
 Base classes for news providers
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Optional, Dict, Any
 import hashlib
+import logging
+import threading
+import time
 
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
-@dataclass
+from .cache import TTLCache
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - presence check; urllib3 does the decoding
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def build_session() -> requests.Session:
+    """Pooled keep-alive session with explicit compression headers
+
+    News JSON is highly compressible (repeated field names and URLs), so
+    advertise brotli where the decoder is installed on top of the default
+    gzip/deflate; fewer bytes on the socket means lower time-to-last-byte.
+    """
+    session = requests.Session()
+    encodings = 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate'
+    session.headers.update({
+        'Accept-Encoding': encodings,
+        'User-Agent': 'ai_invest/1.0',
+    })
+    # Retry connect failures and gateway errors only - never stalled
+    # reads, which would double-bill the provider's rate limit for a
+    # request that may already have been served
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3,
+                          status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=frozenset(['GET', 'HEAD']))
+    ))
+    return session
+
+
+@lru_cache(maxsize=8)
+def _date_window(hour_bucket: int, days: int) -> tuple:
+    """Compute the window strings once per (hour, span) pair"""
+    end = datetime.now()
+    start = end - timedelta(days=days)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+def current_date_window(days: int = 30) -> tuple:
+    """(from, to) date strings for provider queries, stable within the hour
+
+    Hourly granularity keeps the query URL identical across a burst of
+    fetches, so the strftime work runs once and upstream HTTP caches see a
+    repeatable request.
+    """
+    return _date_window(int(time.time() // 3600), days)
+
+
+def decode_json(response) -> Any:
+    """Decode a JSON response body, preferring orjson's C parser
+
+    Provider payloads run to hundreds of kilobytes; orjson parses the raw
+    bytes directly and is several times faster than response.json().
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def retry_after_seconds(response, default: float = 60.0) -> float:
+    """Seconds to back off from a 429's Retry-After header
+
+    Falls back to default when the header is missing or uses the HTTP-date
+    form instead of delta-seconds.
+    """
+    value = response.headers.get('Retry-After')
+    if value is not None:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+    return default
+
+# Symbol-to-company mapping, built once at import instead of per lookup.
+# This could be enhanced with a larger mapping loaded from data
+_COMPANY_NAMES = {
+    'AAPL': 'Apple Inc',
+    'GOOGL': 'Alphabet Inc',
+    'MSFT': 'Microsoft Corporation',
+    'AMZN': 'Amazon.com Inc',
+    'TSLA': 'Tesla Inc',
+    'META': 'Meta Platforms Inc',
+    'NVDA': 'NVIDIA Corporation',
+    'NFLX': 'Netflix Inc'
+}
+
+
+@dataclass(slots=True, frozen=True)
 class NewsArticle:
     """Standard news article data structure"""
     title: str
@@ -21,15 +134,28 @@ class NewsArticle:
     author: Optional[str]
     published_at: datetime
     symbol: Optional[str] = None  # Associated stock symbol
-    
+    # Memoized content_hash; slots classes can't use cached_property, so the
+    # cache lives in an explicit non-comparing slot
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def content_hash(self) -> str:
         """Generate content hash for deduplication"""
-        content_for_hash = f"{self.title}{self.description or ''}{self.url}"
-        return hashlib.sha256(content_for_hash.encode()).hexdigest()
+        # Dedup, caching and the gateway all read this repeatedly, so hash
+        # once per article. Deduplication keys don't need a cryptographic
+        # hash - xxh3 (when installed) or blake2b are several times faster
+        # than SHA-256
+        if self._content_hash is None:
+            content_for_hash = f"{self.title}{self.description or ''}{self.url}"
+            if XXHASH_AVAILABLE:
+                digest = xxhash.xxh3_128(content_for_hash.encode()).hexdigest()
+            else:
+                digest = hashlib.blake2b(content_for_hash.encode(), digest_size=16).hexdigest()
+            object.__setattr__(self, '_content_hash', digest)
+        return self._content_hash
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitStatus:
     """Rate limit status for a provider"""
     requests_remaining: int
@@ -38,6 +164,61 @@ class RateLimitStatus:
     is_limited: bool = False
 
 
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter
+
+    Allows bursts up to capacity and only sleeps when the bucket is truly
+    empty, unlike a fixed per-request sleep which serializes every caller
+    even after long idle gaps.
+    """
+
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum tokens the bucket can hold
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """Block until the requested tokens are available, then consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._last_refill) * self.refill_rate
+                    )
+                    self._last_refill = now
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.refill_rate
+            # Sleep outside the lock so other callers can refill/re-check
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Drain the bucket and hold all callers for the given duration
+
+        Used when the server answers 429 with a Retry-After: the server's
+        own estimate beats our refill math, so stop guessing and wait it
+        out rather than hammering the endpoint with doomed requests.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = 0.0
+            self._last_refill = now
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+
 class NewsProviderError(Exception):
     """Base exception for news provider errors"""
     pass
@@ -50,7 +231,10 @@ class RateLimitExceededError(NewsProviderError):
 
 class NewsProvider(ABC):
     """Abstract base class for news providers"""
-    
+
+    # How long a health-probe result stays valid
+    HEALTH_CHECK_TTL = 30.0
+
     def __init__(self, api_key: str, name: str):
         self.api_key = api_key
         self.name = name
@@ -59,6 +243,16 @@ class NewsProvider(ABC):
             requests_limit=0,
             reset_time=None
         )
+        # Shared disk-backed response cache; a hit skips the HTTP round
+        # trip and spends no rate-limit budget
+        self._response_cache = TTLCache()
+        # Cached heartbeat so health checks don't burn a live request each
+        self._health_checked_at: Optional[float] = None
+        self._health_ok = False
+        # In-flight fetches keyed by (symbol, limit); concurrent callers
+        # for the same key share one request instead of racing duplicates
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     @abstractmethod
     def fetch_news_for_symbol(self, symbol: str, limit: int = 50) -> List[NewsArticle]:
@@ -78,6 +272,91 @@ class NewsProvider(ABC):
         """
         pass
     
+    def _fetch_coalesced(self, symbol: str, limit: int = 50) -> List[NewsArticle]:
+        """Fetch for (symbol, limit), sharing any identical in-flight fetch
+
+        When several gateway threads ask for the same symbol at once, only
+        the first actually hits the provider; the rest block on its future
+        and reuse the result. That spends one rate-limit token instead of N
+        and removes the thundering-herd burst on cache expiry.
+        """
+        key = (symbol.upper(), limit)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = self.fetch_news_for_symbol(symbol, limit)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def iter_news_for_symbol(self, symbol: str, limit: int = 50) -> Iterator[NewsArticle]:
+        """
+        Yield articles for a symbol one at a time
+
+        Lets consumers pipeline per-article work (sentiment scoring, DB
+        writes) without waiting on a fully materialized list at their end.
+        The fetch itself still completes first - responses are decoded and
+        cached whole - so this is an interface for downstream overlap, not
+        network streaming.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            limit: Maximum number of articles to yield
+        """
+        yield from self.fetch_news_for_symbol(symbol, limit)
+
+    def fetch_news_for_symbols(self, symbols: List[str], limit: int = 50,
+                               max_workers: int = 8) -> Dict[str, List[NewsArticle]]:
+        """
+        Fetch news for several symbols concurrently
+
+        Fetches are I/O-bound, so overlapping the network wait across
+        symbols cuts wall-clock time roughly by the worker count. Providers
+        with tight quotas can override to cap workers further; per-request
+        rate limiting still applies inside fetch_news_for_symbol.
+
+        Args:
+            symbols: Stock symbols to fetch news for
+            limit: Maximum number of articles per symbol
+            max_workers: Upper bound on concurrent requests
+
+        Returns:
+            Dictionary mapping each symbol to its articles (empty on failure)
+        """
+        if not symbols:
+            return {}
+
+        results: Dict[str, List[NewsArticle]] = {}
+        with ThreadPoolExecutor(max_workers=min(len(symbols), max_workers)) as executor:
+            futures = {
+                symbol: executor.submit(self._fetch_coalesced, symbol, limit)
+                for symbol in symbols
+            }
+            for symbol, future in futures.items():
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    logger.warning("Error fetching %s news for %s: %s", self.name, symbol, e)
+                    results[symbol] = []
+
+        return results
+
     @abstractmethod
     def get_rate_limit_status(self) -> RateLimitStatus:
         """Get current rate limit status"""
@@ -87,6 +366,24 @@ class NewsProvider(ABC):
     def is_healthy(self) -> bool:
         """Check if the provider is healthy and available"""
         pass
+
+    def _cached_health(self, probe) -> bool:
+        """Run probe() at most once per HEALTH_CHECK_TTL and memoize it
+
+        Liveness checks otherwise cost a live HTTP call (and sometimes a
+        rate-limit token) each time the gateway asks.
+        """
+        now = time.monotonic()
+        if (self._health_checked_at is not None and
+                now - self._health_checked_at < self.HEALTH_CHECK_TTL):
+            return self._health_ok
+        self._health_ok = probe()
+        self._health_checked_at = now
+        return self._health_ok
+
+    def _invalidate_health(self):
+        """Drop the memoized heartbeat so the next check probes live"""
+        self._health_checked_at = None
     
     def _update_rate_limit_status(self, headers: Dict[str, Any]):
         """Update rate limit status from response headers"""
@@ -95,15 +392,4 @@ class NewsProvider(ABC):
     
     def _get_company_name(self, symbol: str) -> str:
         """Get company name for symbol (basic implementation)"""
-        # This could be enhanced with a symbol-to-company mapping
-        company_names = {
-            'AAPL': 'Apple Inc',
-            'GOOGL': 'Alphabet Inc',
-            'MSFT': 'Microsoft Corporation',
-            'AMZN': 'Amazon.com Inc',
-            'TSLA': 'Tesla Inc',
-            'META': 'Meta Platforms Inc',
-            'NVDA': 'NVIDIA Corporation',
-            'NFLX': 'Netflix Inc'
-        }
-        return company_names.get(symbol.upper(), symbol)
\ No newline at end of file
+        return _COMPANY_NAMES.get(symbol.upper(), symbol)
\ No newline at end of file
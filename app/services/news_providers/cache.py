@@ -0,0 +1,70 @@
+"""
+Disk-backed TTL cache for news provider responses
+"""
+import hashlib
+import logging
+import os
+import pickle
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """File-backed cache with per-entry expiry
+
+    News for a symbol rarely changes within minutes, but every fetch paid
+    the full HTTP round trip and burned rate-limit budget. A cache hit here
+    skips the network entirely. Entries are pickle blobs (NewsArticle lists
+    round-trip natively) keyed by an md5 of the logical key, mirroring the
+    file layout used by the main CacheManager.
+    """
+
+    def __init__(self, cache_dir: str = "cache/news_responses", default_ttl: int = 900):
+        """
+        Args:
+            cache_dir: Directory for cache entry files
+            default_ttl: Entry lifetime in seconds (default 15 minutes)
+        """
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Filesystem path for a logical cache key"""
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        except Exception as e:
+            logger.warning("Error reading news cache entry %s: %s", key, e)
+            return None
+
+        if time.time() >= expires_at:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store value under key for ttl seconds (default_ttl if omitted)"""
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((expires_at, value), f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Error writing news cache entry %s: %s", key, e)
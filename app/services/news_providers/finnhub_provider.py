@@ -1,11 +1,17 @@
 """
 Finnhub news provider implementation
 """
+import logging
 import requests
-import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
-from .base import NewsProvider, NewsArticle, RateLimitStatus, NewsProviderError, RateLimitExceededError
+from .base import (
+    NewsProvider, NewsArticle, RateLimitStatus, TokenBucket,
+    NewsProviderError, RateLimitExceededError, decode_json, current_date_window,
+    build_session, retry_after_seconds
+)
+
+logger = logging.getLogger(__name__)
 
 
 class FinnhubProvider(NewsProvider):
@@ -15,7 +21,17 @@ class FinnhubProvider(NewsProvider):
         super().__init__(api_key, "Finnhub")
         self.base_url = "https://finnhub.io/api/v1"
         self.requests_per_minute = 60  # Free tier limit
-        self.last_request_time = None
+        # 60 tokens refilled at 1/s: a batch after an idle minute runs
+        # back-to-back instead of sleeping a second per call
+        self._bucket = TokenBucket(capacity=self.requests_per_minute,
+                                   refill_rate=self.requests_per_minute / 60.0)
+        # Keep-alive session so repeated calls reuse the TLS connection to
+        # finnhub.io instead of paying a handshake per request
+        self._session = build_session()
+        # Endpoint URL and static params bound once; the hot path only
+        # merges in the per-request fields
+        self._news_url = f"{self.base_url}/company-news"
+        self._base_params = {'token': self.api_key}
     
     def fetch_news_for_symbol(self, symbol: str, limit: int = 50) -> List[NewsArticle]:
         """
@@ -31,24 +47,28 @@ class FinnhubProvider(NewsProvider):
         if not self.api_key:
             raise NewsProviderError("Finnhub API key not provided")
         
-        # Respect rate limits (60 calls/minute = 1 per second)
-        self._enforce_rate_limit()
-        
+        # Serve recent fetches from the disk cache before spending tokens
+        cache_key = f"{self.name}:{symbol}:{limit}"
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Respect rate limits (60 calls/minute)
+        self._bucket.acquire()
+
         try:
-            # Use dynamic date range to get recent news
-            current_date = datetime.now()
-            start_date = (current_date - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = current_date.strftime('%Y-%m-%d')
-            
-            url = f"{self.base_url}/company-news"
+            # Use dynamic date range to get recent news (hourly-stable
+            # strings, computed once per hour instead of per request)
+            start_date, end_date = current_date_window(days=30)
+
             params = {
+                **self._base_params,
                 'symbol': symbol.upper(),
                 'from': start_date,
-                'to': end_date,
-                'token': self.api_key
+                'to': end_date
             }
-            
-            response = requests.get(url, params=params, timeout=10)
+
+            response = self._session.get(self._news_url, params=params, timeout=10)
             
             # Update rate limit status
             self._update_rate_limit_from_response(response)
@@ -58,22 +78,21 @@ class FinnhubProvider(NewsProvider):
             elif response.status_code != 200:
                 raise NewsProviderError(f"Finnhub API returned status {response.status_code}")
             
-            news_data = response.json()
+            news_data = decode_json(response)
             
             if not news_data:
                 return []
-            
-            # Convert to NewsArticle objects
-            articles = []
-            for item in news_data[:limit]:
-                try:
-                    article = self._parse_article(item, symbol)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    print(f"Error parsing Finnhub article: {e}")
-                    continue
-            
+
+            # Convert to NewsArticle objects in one comprehension; the
+            # symbol is uppercased once here rather than per article, and
+            # _parse_article returns None for malformed items
+            sym_upper = symbol.upper()
+            articles = [
+                article for item in news_data[:limit]
+                if (article := self._parse_article(item, sym_upper)) is not None
+            ]
+
+            self._response_cache.set(cache_key, articles)
             return articles
             
         except requests.RequestException as e:
@@ -86,40 +105,37 @@ class FinnhubProvider(NewsProvider):
         return self._rate_limit_status
     
     def is_healthy(self) -> bool:
-        """Check if Finnhub provider is healthy"""
+        """Check if Finnhub provider is healthy (memoized for 30s)"""
         if not self.api_key:
             return False
-        
+        return self._cached_health(self._probe_health)
+
+    def _probe_health(self) -> bool:
+        """Live health probe against the company-news endpoint"""
         try:
             # Simple health check - get news for a common symbol
-            url = f"{self.base_url}/company-news"
             params = {
+                **self._base_params,
                 'symbol': 'AAPL',
                 'from': '2024-01-01',
-                'to': '2024-01-02',
-                'token': self.api_key
+                'to': '2024-01-02'
             }
-            
-            response = requests.get(url, params=params, timeout=5)
+
+            response = self._session.get(self._news_url, params=params, timeout=5)
             return response.status_code in [200, 429]  # 429 means we're rate limited but API is working
             
         except Exception:
             return False
     
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting (1 request per second for free tier)"""
-        if self.last_request_time:
-            time_since_last = time.time() - self.last_request_time
-            if time_since_last < 1.0:  # Less than 1 second
-                time.sleep(1.0 - time_since_last)
-        
-        self.last_request_time = time.time()
-    
     def _update_rate_limit_from_response(self, response):
         """Update rate limit status from Finnhub response headers"""
         # Finnhub doesn't provide detailed rate limit headers in free tier
         # We'll estimate based on known limits
         if response.status_code == 429:
+            # Hold the bucket for as long as the server asked; force the
+            # next health check to probe live
+            self._bucket.penalize(retry_after_seconds(response))
+            self._invalidate_health()
             self._rate_limit_status = RateLimitStatus(
                 requests_remaining=0,
                 requests_limit=self.requests_per_minute,
@@ -136,36 +152,43 @@ class FinnhubProvider(NewsProvider):
             )
     
     def _parse_article(self, item: dict, symbol: str) -> Optional[NewsArticle]:
-        """Parse Finnhub article data into NewsArticle object"""
+        """Parse Finnhub article data into NewsArticle object
+
+        Expects symbol already uppercased by the caller.
+        """
         try:
-            # Extract required fields
-            headline = item.get('headline', '')
-            summary = item.get('summary', '')
-            url = item.get('url', '')
-            
+            # Extract required fields via one bound lookup
+            get = item.get
+            headline = get('headline', '')
+            summary = get('summary', '')
+            url = get('url', '')
+
             if not headline or not url:
                 return None
-            
+
             # Parse timestamp
-            published_timestamp = item.get('datetime')
+            published_timestamp = get('datetime')
             if published_timestamp:
                 published_at = datetime.fromtimestamp(published_timestamp, tz=timezone.utc)
             else:
                 published_at = datetime.now(timezone.utc)
-            
+
+            # Positional construction skips the kwargs dict on this hot
+            # path; field order matches the NewsArticle declaration.
+            # Finnhub provides neither full content nor author info
             return NewsArticle(
-                title=headline,
-                description=summary,
-                content=None,  # Finnhub doesn't provide full content
-                url=url,
-                url_to_image=item.get('image'),
-                source_name=item.get('source', 'Finnhub'),
-                source_id=item.get('id'),
-                author=None,  # Finnhub doesn't provide author info
-                published_at=published_at,
-                symbol=symbol.upper()
+                headline,         # title
+                summary,          # description
+                None,             # content
+                url,              # url
+                get('image'),     # url_to_image
+                get('source', 'Finnhub'),  # source_name
+                get('id'),        # source_id
+                None,             # author
+                published_at,
+                symbol
             )
-            
+
         except Exception as e:
-            print(f"Error parsing Finnhub article: {e}")
+            logger.warning("Error parsing Finnhub article: %s", e)
             return None
\ No newline at end of file
@@ -4,76 +4,168 @@ Provides async wrappers for CPU-intensive tasks
 """
 import asyncio
 import functools
-from typing import Any, Callable, TypeVar
+import pickle
+import sys
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar
 from fastapi import Request
 
 T = TypeVar('T')
 
-async def run_in_thread_pool(request: Request, func: Callable[..., T], *args, **kwargs) -> T:
+# Current request's executor, set once by middleware in app.main. A
+# ContextVar read is a single C-level call, and code deep in a call
+# stack can dispatch without having `request` threaded through to it
+THREAD_POOL: ContextVar[Optional[Any]] = ContextVar('thread_pool', default=None)
+PROCESS_POOL: ContextVar[Optional[Any]] = ContextVar('process_pool', default=None)
+
+# Fallback memo for callers that still pass a request before the
+# middleware has populated the ContextVar; the app's executor never
+# changes after startup
+_thread_pool = None
+_thread_pool_resolved = False
+
+def _get_thread_pool(request: Optional[Request]):
+    """Resolve the executor from the request context (or app state)"""
+    pool = THREAD_POOL.get()
+    if pool is not None or request is None:
+        return pool
+    global _thread_pool, _thread_pool_resolved
+    if not _thread_pool_resolved:
+        _thread_pool = getattr(request.app.state, 'thread_pool', None)
+        _thread_pool_resolved = True
+    return _thread_pool
+
+async def run_in_thread_pool(request: Optional[Request], func: Callable[..., T], *args, **kwargs) -> T:
     """
     Run a CPU-intensive function in the application's thread pool
-    
+
     Args:
-        request: FastAPI request object to access app state
+        request: FastAPI request object to access app state; may be None
+            when the executor ContextVar has been set by middleware
         func: The function to run in thread pool
         *args: Positional arguments for the function
         **kwargs: Keyword arguments for the function
-    
+
     Returns:
         The result of the function execution
     """
-    loop = asyncio.get_event_loop()
-    thread_pool = getattr(request.app.state, 'thread_pool', None)
-    
-    if thread_pool is None:
-        # Fallback to default thread pool if not available
-        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
-    
-    return await loop.run_in_executor(
-        thread_pool, 
-        functools.partial(func, *args, **kwargs)
-    )
-
-async def run_cpu_intensive_task(request: Request, task_func: Callable[..., T], *args, **kwargs) -> T:
+    # A coroutine always runs inside a loop, so the C-level
+    # get_running_loop() lookup replaces get_event_loop()'s policy walk
+    # (and its DeprecationWarning in coroutine contexts on 3.12+)
+    loop = asyncio.get_running_loop()
+    thread_pool = _get_thread_pool(request)
+
+    # run_in_executor takes positional args directly; only kwargs need the
+    # functools.partial wrapper, so the common no-kwargs dispatch skips the
+    # extra allocation and indirection
+    if kwargs:
+        return await loop.run_in_executor(
+            thread_pool,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    return await loop.run_in_executor(thread_pool, func, *args)
+
+def _get_process_pool(request: Optional[Request]):
+    """Resolve the process pool from the request context (or app state)"""
+    pool = PROCESS_POOL.get()
+    if pool is not None or request is None:
+        return pool
+    return getattr(request.app.state, 'process_pool', None)
+
+def _is_picklable(func: Callable) -> bool:
+    """Whether func can cross a process boundary"""
+    try:
+        pickle.dumps(func)
+        return True
+    except Exception:
+        return False
+
+async def run_cpu_intensive_task(request: Request, task_func: Callable[..., T], *args,
+                                 kind: str = 'cpu', **kwargs) -> T:
     """
     Convenience wrapper for running CPU-intensive tasks
-    
+
     This is useful for:
     - Data analysis and calculations
     - Technical indicator computations
     - AI model inference
     - PDF generation
     - Large data processing
-    
+
+    Pure-CPU work is GIL-bound in the thread pool, so kind='cpu' (the
+    default) dispatches to the process pool for real parallelism when the
+    callable survives pickling; kind='io' or an unpicklable callable
+    falls back to the thread pool, where the GIL is released during I/O
+    anyway.
+
     Args:
         request: FastAPI request object
         task_func: The CPU-intensive function to execute
         *args: Arguments for the function
+        kind: 'cpu' to prefer the process pool, 'io' for the thread pool
         **kwargs: Keyword arguments for the function
-    
+
     Returns:
         Result of the task execution
     """
+    if kind == 'cpu':
+        pool = _get_process_pool(request)
+        if pool is not None and _is_picklable(task_func):
+            loop = asyncio.get_running_loop()
+            try:
+                if kwargs:
+                    return await loop.run_in_executor(
+                        pool, functools.partial(task_func, *args, **kwargs))
+                return await loop.run_in_executor(pool, task_func, *args)
+            except pickle.PicklingError:
+                # Unpicklable argument surfaced at submit time; the task
+                # never ran, so retrying on the thread pool is safe
+                pass
     return await run_in_thread_pool(request, task_func, *args, **kwargs)
 
-def cpu_intensive(func: Callable[..., T]) -> Callable:
+def cpu_intensive(func: Optional[Callable[..., T]] = None, *, kind: str = 'cpu') -> Callable:
     """
     Decorator to mark functions as CPU-intensive and automatically
     run them in thread pool when called from async context
-    
+
     Usage:
         @cpu_intensive
         def heavy_calculation(data):
             # CPU-intensive work here
             return result
-            
+
         # In async route:
         result = await heavy_calculation(request, data)
+
+    Usable bare or parameterized: @cpu_intensive(kind='io') keeps the
+    task on the thread pool, the default prefers the process pool.
     """
-    @functools.wraps(func)
-    async def async_wrapper(request: Request, *args, **kwargs) -> T:
-        return await run_in_thread_pool(request, func, *args, **kwargs)
-    
-    # Keep original function available as .sync for synchronous calls
-    async_wrapper.sync = func
-    return async_wrapper 
\ No newline at end of file
+    def decorate(f: Callable[..., T]) -> Callable:
+        @functools.wraps(f)
+        async def async_wrapper(request: Request, *args, **kwargs) -> T:
+            return await run_cpu_intensive_task(request, f, *args, kind=kind, **kwargs)
+
+        # Keep original function available as .sync for synchronous calls
+        async_wrapper.sync = f
+
+        # functools.wraps points the module-level name at the async
+        # wrapper, so pickling f by its original name fails the identity
+        # check and process-pool dispatch would silently fall back to the
+        # thread pool for every decorated function. Re-register the
+        # undecorated function under an alias pickle can resolve (only
+        # possible for plain module-level functions - methods and nested
+        # functions stay unpicklable and keep the thread-pool fallback)
+        if f.__qualname__ == f.__name__:
+            module = sys.modules.get(f.__module__)
+            if module is not None:
+                alias = f'_{f.__name__}__cpu_impl'
+                f.__name__ = alias
+                f.__qualname__ = alias
+                setattr(module, alias, f)
+
+        return async_wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
\ No newline at end of file
@@ -1,11 +1,17 @@
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from copy import deepcopy
+from datetime import date, datetime, timedelta, timezone
+from math import exp, log
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import hashlib
 import json
 import os
+import pickle
+import time
 from data_storage import InvestmentDataStorage
 from data_fetcher import get_stock_data, calculate_technical_indicators
 from ai_analyzer import get_sentiment_analysis, get_ai_recommendation
@@ -36,45 +42,146 @@ class WhatIfScenario:
     name: str
     description: str
     parameters: Dict
-    
+
+
+def _run_scenario_worker(initial_capital: float, symbols: List[str], start_date: str,
+                         end_date: str, strategy: 'InvestmentStrategy') -> 'BacktestResult':
+    """Simulate one scenario in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it; builds a fresh
+    engine in the child rather than shipping the parent's over.
+    """
+    engine = BacktestEngine(initial_capital)
+    return engine.simulate_strategy(symbols, start_date, end_date, strategy)
+
+
 class BacktestEngine:
     """Advanced backtesting engine for strategy validation and what-if analysis"""
     
+    # Where memoized history downloads live, shared across processes
+    HISTORY_CACHE_DIR = "cache/backtest_history"
+    HISTORY_CACHE_TTL = 86400  # Seconds; 1 day covers a what-if session
+
     def __init__(self, initial_capital: float = 10000.0):
         self.initial_capital = initial_capital
         self.storage = InvestmentDataStorage()
         self.strategy_manager = StrategyManager()
-        
+        # Per-engine memo so repeated simulations in one process skip
+        # even the disk read
+        self._history_cache: Dict[tuple, Dict[str, pd.DataFrame]] = {}
+
     def get_historical_data(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
-        """Fetch historical data for backtesting"""
+        """Fetch historical data for backtesting
+
+        Memoized per (symbols, start, end) in memory and on disk: a
+        what-if run simulates the same period eight times (base plus
+        seven scenarios, possibly in worker processes), and without the
+        cache each run re-downloaded identical history from yfinance.
+        Callers must treat the returned frames as read-only.
+        """
         historical_data = {}
-        
-        for symbol in symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-                data = ticker.history(start=start_date, end=end_date)
-                
-                if not data.empty:
-                    # Add technical indicators
-                    data['RSI'] = self._calculate_rsi(data['Close'])
-                    data['MA_20'] = data['Close'].rolling(window=20).mean()
-                    data['MA_50'] = data['Close'].rolling(window=50).mean()
-                    
-                    historical_data[symbol] = data
-                else:
-                    print(f"⚠️ No data found for {symbol}")
-                    
-            except Exception as e:
-                print(f"❌ Error fetching data for {symbol}: {e}")
-                
+
+        if not symbols:
+            return historical_data
+
+        cache_key = (tuple(sorted(symbols)), start_date, end_date)
+        cached = self._history_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        cached = self._load_history_from_disk(cache_key)
+        if cached is not None:
+            self._history_cache[cache_key] = cached
+            return cached
+
+        # Each download is network-bound and the GIL is released during
+        # the wait, so fetching symbols concurrently cuts wall time to
+        # roughly one round trip instead of one per symbol
+        max_workers = min(len(symbols), 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                symbol: executor.submit(self._fetch_symbol_history, symbol, start_date, end_date)
+                for symbol in symbols
+            }
+            for symbol, future in futures.items():
+                try:
+                    data = future.result()
+                    if data is not None:
+                        historical_data[symbol] = data
+                    else:
+                        print(f"⚠️ No data found for {symbol}")
+
+                except Exception as e:
+                    print(f"❌ Error fetching data for {symbol}: {e}")
+
+        # Only memoize complete downloads: caching a partial result under
+        # the full-symbol-set key would pin the failed symbol out of every
+        # simulation until the TTL expires, instead of retrying it on the
+        # next call
+        if len(historical_data) == len(futures):
+            self._history_cache[cache_key] = historical_data
+            self._store_history_to_disk(cache_key, historical_data)
+
         return historical_data
+
+    def _history_cache_path(self, cache_key: tuple) -> str:
+        """Filesystem path for a memoized history download"""
+        digest = hashlib.md5(repr(cache_key).encode()).hexdigest()
+        return os.path.join(self.HISTORY_CACHE_DIR, f"{digest}.pkl")
+
+    def _load_history_from_disk(self, cache_key: tuple) -> Optional[Dict[str, pd.DataFrame]]:
+        """Read a memoized download, discarding expired entries"""
+        path = self._history_cache_path(cache_key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.HISTORY_CACHE_TTL:
+                os.remove(path)
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except OSError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Error reading history cache: {e}")
+            return None
+
+    def _store_history_to_disk(self, cache_key: tuple, historical_data: Dict[str, pd.DataFrame]):
+        """Persist a download so other processes can reuse it"""
+        path = self._history_cache_path(cache_key)
+        try:
+            os.makedirs(self.HISTORY_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(historical_data, f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ Error writing history cache: {e}")
+
+    def _fetch_symbol_history(self, symbol: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """Download one symbol's history and attach technical indicators"""
+        ticker = yf.Ticker(symbol)
+        data = ticker.history(start=start_date, end=end_date)
+
+        if data.empty:
+            return None
+
+        # Add technical indicators
+        data['RSI'] = self._calculate_rsi(data['Close'])
+        data['MA_20'] = data['Close'].rolling(window=20).mean()
+        data['MA_50'] = data['Close'].rolling(window=50).mean()
+
+        return data
     
     def _calculate_rsi(self, prices: pd.Series, window: int = 14) -> pd.Series:
-        """Calculate RSI indicator"""
+        """Calculate RSI indicator (Wilder's smoothing)"""
+        # Wilder's recursive average avg = (avg*(w-1) + x)/w is exactly an
+        # EWM with alpha=1/w, which pandas computes in one C-level pass -
+        # no Python loop, and truer to the textbook RSI than the previous
+        # simple rolling mean
         delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
+        gain = delta.clip(lower=0.0)
+        loss = -delta.clip(upper=0.0)
+        avg_gain = gain.ewm(alpha=1.0 / window, adjust=False, min_periods=window).mean()
+        avg_loss = loss.ewm(alpha=1.0 / window, adjust=False, min_periods=window).mean()
+        rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
         return rsi
     
@@ -97,100 +204,133 @@ class BacktestEngine:
             raise ValueError("No historical data available for backtesting")
         
         # Initialize portfolio
-        portfolio_value = self.initial_capital
-        positions = {}
         cash = self.initial_capital
         trades = []
-        daily_values = []
-        
-        # Get all trading dates
-        all_dates = sorted(set().union(*[data.index for data in historical_data.values()]))
-        
-        for date in all_dates:
-            daily_portfolio_value = cash
-            
-            # Update position values
-            for symbol, shares in positions.items():
-                if symbol in historical_data and date in historical_data[symbol].index:
-                    current_price = historical_data[symbol].loc[date, 'Close']
-                    daily_portfolio_value += shares * current_price
-            
-            daily_values.append({
-                'date': date,
-                'portfolio_value': daily_portfolio_value,
-                'cash': cash,
-                'positions': positions.copy()
-            })
-            
+
+        # Reshape the per-symbol frames into dense (n_days, n_symbols)
+        # float64 matrices on the union calendar. The day loop then reads
+        # plain ndarray scalars instead of df.loc lookups, each of which
+        # costs microseconds of pandas indexing machinery - over
+        # days x symbols cells that indexing dominated the whole backtest
+        sym_list = [s for s in symbols if s in historical_data]
+        master_index = pd.DatetimeIndex(
+            sorted(set().union(*[data.index for data in historical_data.values()]))
+        )
+        n_days = len(master_index)
+        n_syms = len(sym_list)
+
+        close = np.empty((n_days, n_syms), dtype=np.float64)
+        rsi_m = np.empty((n_days, n_syms), dtype=np.float64)
+        ma20_m = np.empty((n_days, n_syms), dtype=np.float64)
+        ma50_m = np.empty((n_days, n_syms), dtype=np.float64)
+        last_close = np.empty(n_syms, dtype=np.float64)
+        for j, sym in enumerate(sym_list):
+            df = historical_data[sym]
+            last_close[j] = df['Close'].iloc[-1]
+            aligned = df.reindex(master_index)
+            close[:, j] = aligned['Close'].to_numpy(dtype=np.float64)
+            rsi_m[:, j] = aligned['RSI'].to_numpy(dtype=np.float64)
+            ma20_m[:, j] = aligned['MA_20'].to_numpy(dtype=np.float64)
+            ma50_m[:, j] = aligned['MA_50'].to_numpy(dtype=np.float64)
+        # A symbol without a bar on a given day reindexes to NaN, so the
+        # old membership test against df.index becomes one FP check
+        valid = ~np.isnan(close)
+
+        # Precompute every (day, symbol) signal with fused boolean ops
+        # instead of a Python _generate_signal call per cell. The nested
+        # where chain mirrors that function's precedence exactly: RSI
+        # buy, then RSI sell, then MA-crossover buy, then crossover sell.
+        # NaN indicators compare False on every branch and land on HOLD,
+        # so warm-up rows come out 0 without special-casing
+        with np.errstate(invalid='ignore'):
+            rsi_buy = (rsi_m < strategy.rsi_oversold_threshold) & (close > ma20_m)
+            rsi_sell = rsi_m > strategy.rsi_overbought_threshold
+            cross_buy = (ma20_m > ma50_m) & (close > ma20_m)
+            cross_sell = (ma20_m < ma50_m) & (close < ma20_m)
+        signals = np.where(
+            rsi_buy, 1, np.where(
+                rsi_sell, -1, np.where(
+                    cross_buy, 1, np.where(cross_sell, -1, 0)))
+        ).astype(np.int8)
+
+        positions = np.zeros(n_syms, dtype=np.int64)
+        # Dense value history: the metrics only ever read the portfolio
+        # value series, so a flat float64 buffer replaces the old per-day
+        # dict (which copied the whole positions map every day, purely to
+        # be thrown away)
+        portfolio_values = np.empty(n_days, dtype=np.float64)
+
+        for d in range(n_days):
+            date = master_index[d]
+            row_close = close[d]
+            row_valid = valid[d]
+
+            # Update position values; symbols without a bar today
+            # contribute nothing, matching the old membership check
+            daily_portfolio_value = cash + float(
+                (positions * np.where(row_valid, row_close, 0.0)).sum()
+            )
+            portfolio_values[d] = daily_portfolio_value
+
             # Generate trading signals for each symbol
-            for symbol in symbols:
-                if symbol not in historical_data or date not in historical_data[symbol].index:
+            for j in range(n_syms):
+                if not row_valid[j]:
                     continue
-                    
-                current_data = historical_data[symbol].loc[date]
-                current_price = current_data['Close']
-                rsi = current_data.get('RSI', 50)
-                ma_20 = current_data.get('MA_20', current_price)
-                ma_50 = current_data.get('MA_50', current_price)
-                
-                # Apply strategy rules
-                signal = self._generate_signal(symbol, current_price, rsi, ma_20, ma_50, strategy)
-                
-                if signal == 'BUY' and cash >= current_price * 100:  # Buy 100 shares minimum
+
+                current_price = row_close[j]
+                signal = signals[d, j]
+
+                if signal == 1 and cash >= current_price * 100:  # Buy 100 shares minimum
                     # Calculate position size based on strategy
                     max_position_value = daily_portfolio_value * (strategy.max_position_size_percent / 100)
                     shares_to_buy = min(int(max_position_value / current_price), int(cash / current_price))
-                    
+
                     if shares_to_buy > 0:
                         cost = shares_to_buy * current_price
                         cash -= cost
-                        
-                        if symbol in positions:
-                            positions[symbol] += shares_to_buy
-                        else:
-                            positions[symbol] = shares_to_buy
-                        
+                        positions[j] += shares_to_buy
+
                         trades.append({
                             'date': date,
-                            'symbol': symbol,
+                            'symbol': sym_list[j],
                             'action': 'BUY',
                             'shares': shares_to_buy,
                             'price': current_price,
                             'cost': cost
                         })
-                
-                elif signal == 'SELL' and symbol in positions and positions[symbol] > 0:
-                    shares_to_sell = positions[symbol]
+
+                elif signal == -1 and positions[j] > 0:
+                    shares_to_sell = int(positions[j])
                     revenue = shares_to_sell * current_price
                     cash += revenue
-                    
+
                     trades.append({
                         'date': date,
-                        'symbol': symbol,
+                        'symbol': sym_list[j],
                         'action': 'SELL',
                         'shares': shares_to_sell,
                         'price': current_price,
                         'revenue': revenue
                     })
-                    
-                    del positions[symbol]
-        
-        # Calculate final portfolio value
-        final_value = cash
-        for symbol, shares in positions.items():
-            if symbol in historical_data:
-                final_price = historical_data[symbol].iloc[-1]['Close']
-                final_value += shares * final_price
+
+                    positions[j] = 0
+
+        # Calculate final portfolio value at each symbol's last real bar
+        final_value = cash + float((positions * last_close).sum())
         
         # Calculate performance metrics
         return self._calculate_backtest_metrics(
-            daily_values, trades, final_value, start_date, end_date, strategy.name
+            portfolio_values, trades, final_value, start_date, end_date, strategy.name
         )
     
-    def _generate_signal(self, symbol: str, price: float, rsi: float, ma_20: float, 
+    def _generate_signal(self, symbol: str, price: float, rsi: float, ma_20: float,
                         ma_50: float, strategy: InvestmentStrategy) -> str:
-        """Generate buy/sell/hold signal based on strategy parameters"""
-        
+        """Generate buy/sell/hold signal based on strategy parameters
+
+        Scalar reference implementation; simulate_strategy evaluates the
+        same rules vectorized over the whole (days, symbols) grid.
+        """
+
         # RSI-based signals
         if rsi < strategy.rsi_oversold_threshold and price > ma_20:
             return 'BUY'
@@ -205,7 +345,7 @@ class BacktestEngine:
         
         return 'HOLD'
     
-    def _calculate_backtest_metrics(self, daily_values: List[Dict], trades: List[Dict], 
+    def _calculate_backtest_metrics(self, portfolio_values: np.ndarray, trades: List[Dict],
                                   final_value: float, start_date: str, end_date: str,
                                   strategy_name: str) -> BacktestResult:
         """Calculate comprehensive backtest performance metrics"""
@@ -213,60 +353,58 @@ class BacktestEngine:
         # Calculate returns
         total_return = (final_value - self.initial_capital) / self.initial_capital * 100
         
-        # Calculate annualized return
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
+        # Calculate annualized return. fromisoformat takes CPython's fast
+        # C path instead of strptime's format-string interpreter, and
+        # exp(log(x)/y) beats the generic pow for the fractional root
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
         years = (end - start).days / 365.25
-        annualized_return = (pow(final_value / self.initial_capital, 1/years) - 1) * 100 if years > 0 else 0
-        
-        # Calculate max drawdown
-        portfolio_values = [d['portfolio_value'] for d in daily_values]
-        peak = portfolio_values[0]
-        max_drawdown = 0
-        
-        for value in portfolio_values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak * 100
-            max_drawdown = max(max_drawdown, drawdown)
+        if years > 0 and final_value > 0:
+            annualized_return = (exp(log(final_value / self.initial_capital) / years) - 1) * 100
+        else:
+            annualized_return = 0
         
+        # Calculate max drawdown: running peak via maximum.accumulate and
+        # one vectorized expression instead of a Python loop over days
+        peaks = np.maximum.accumulate(portfolio_values)
+        max_drawdown = float(((peaks - portfolio_values) / peaks).max() * 100)
+
         # Calculate Sharpe ratio (simplified, assuming 2% risk-free rate)
-        if len(portfolio_values) > 1:
-            returns = [(portfolio_values[i] - portfolio_values[i-1]) / portfolio_values[i-1] 
-                      for i in range(1, len(portfolio_values))]
-            if returns:
-                avg_return = np.mean(returns) * 252  # Annualized
-                std_return = np.std(returns) * np.sqrt(252)  # Annualized
-                sharpe_ratio = (avg_return - 0.02) / std_return if std_return > 0 else 0
-            else:
-                sharpe_ratio = 0
+        if portfolio_values.size > 1:
+            returns = np.diff(portfolio_values) / portfolio_values[:-1]
+            avg_return = returns.mean() * 252  # Annualized
+            std_return = returns.std() * np.sqrt(252)  # Annualized
+            sharpe_ratio = float((avg_return - 0.02) / std_return) if std_return > 0 else 0
         else:
             sharpe_ratio = 0
         
-        # Analyze trades
-        winning_trades = sum(1 for trade in trades if trade['action'] == 'SELL' and 
-                           any(t['action'] == 'BUY' and t['symbol'] == trade['symbol'] 
-                               and t['price'] < trade['price'] for t in trades))
-        
-        total_trades = len([t for t in trades if t['action'] == 'SELL'])
-        losing_trades = total_trades - winning_trades
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        
-        # Calculate average gains/losses
+        # Analyze trades in one chronological pass (trades arrive sorted),
+        # tracking the most recent buy price per symbol. The old code
+        # rescanned the full trade list for every SELL - O(T^2) in trade
+        # count - and counted a SELL as winning if *any* buy of that
+        # symbol was cheaper; wins are now consistent with the P&L
+        # computed against the most recent buy
+        last_buy_price = {}
+        winning_trades = 0
+        total_trades = 0
         gains = []
         losses = []
         for trade in trades:
-            if trade['action'] == 'SELL':
-                # Find corresponding buy trade
-                buy_trades = [t for t in trades if t['action'] == 'BUY' and 
-                             t['symbol'] == trade['symbol'] and t['date'] < trade['date']]
-                if buy_trades:
-                    buy_price = buy_trades[-1]['price']  # Most recent buy
+            if trade['action'] == 'BUY':
+                last_buy_price[trade['symbol']] = trade['price']
+            elif trade['action'] == 'SELL':
+                total_trades += 1
+                buy_price = last_buy_price.get(trade['symbol'])
+                if buy_price:
                     pnl_percent = (trade['price'] - buy_price) / buy_price * 100
                     if pnl_percent > 0:
+                        winning_trades += 1
                         gains.append(pnl_percent)
                     else:
                         losses.append(abs(pnl_percent))
+
+        losing_trades = total_trades - winning_trades
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
         
         avg_gain = np.mean(gains) if gains else 0
         avg_loss = np.mean(losses) if losses else 0
@@ -335,38 +473,50 @@ class BacktestEngine:
         ]
         
         results = {}
-        
+
         # Run base strategy first
         print(f"\n🔬 Running What-If Analysis")
         print(f"📊 Base Strategy: {base_strategy.name}")
-        
+
         base_result = self.simulate_strategy(symbols, start_date, end_date, base_strategy)
         results["Base Strategy"] = base_result
-        
-        # Run scenario variations
+
+        # Each scenario is an independent simulation of the same period -
+        # embarrassingly parallel, so fan them out across processes and
+        # bypass the GIL. Strategies are deep-copied per scenario: the old
+        # serial loop mutated base_strategy in place, so every run after
+        # the first tested an accumulation of all prior tweaks
+        scenario_strategies = {}
         for scenario in scenarios:
-            print(f"\n🧪 Testing: {scenario.name}")
-            
-            # Create modified strategy
-            modified_strategy = base_strategy
+            modified_strategy = deepcopy(base_strategy)
             for param, value in scenario.parameters.items():
                 setattr(modified_strategy, param, value)
-            
             modified_strategy.name = f"{base_strategy.name} - {scenario.name}"
-            
-            try:
-                result = self.simulate_strategy(symbols, start_date, end_date, modified_strategy)
-                results[scenario.name] = result
-                
-                # Show comparison
-                improvement = result.total_return - base_result.total_return
-                print(f"   📈 Total Return: {result.total_return:.2f}% ({improvement:+.2f}% vs base)")
-                print(f"   📉 Max Drawdown: {result.max_drawdown:.2f}%")
-                print(f"   🎯 Win Rate: {result.win_rate:.1f}%")
-                
-            except Exception as e:
-                print(f"   ❌ Error testing {scenario.name}: {e}")
-        
+            scenario_strategies[scenario.name] = modified_strategy
+
+        max_workers = min(len(scenarios), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_run_scenario_worker, self.initial_capital,
+                                symbols, start_date, end_date, strategy): name
+                for name, strategy in scenario_strategies.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                print(f"\n🧪 Tested: {name}")
+                try:
+                    result = future.result()
+                    results[name] = result
+
+                    # Show comparison
+                    improvement = result.total_return - base_result.total_return
+                    print(f"   📈 Total Return: {result.total_return:.2f}% ({improvement:+.2f}% vs base)")
+                    print(f"   📉 Max Drawdown: {result.max_drawdown:.2f}%")
+                    print(f"   🎯 Win Rate: {result.win_rate:.1f}%")
+
+                except Exception as e:
+                    print(f"   ❌ Error testing {name}: {e}")
+
         return results
     
     def validate_historical_predictions(self, days_back: int = 30) -> Dict:
@@ -499,68 +649,69 @@ class BacktestEngine:
         if len(sentiment_history) < 5:
             return {"error": "Insufficient sentiment history"}
         
-        # Analyze sentiment vs future returns
-        predictive_analysis = []
-        
-        for i, record in enumerate(sentiment_history[:-3]):  # Leave 3 days for future analysis
-            current_sentiment = record['sentiment']
-            current_price = record['price']
-            
-            # Look at price 3 days later
-            future_record = sentiment_history[i + 3] if i + 3 < len(sentiment_history) else None
-            
-            if future_record and current_price and future_record['price']:
-                future_return = (future_record['price'] - current_price) / current_price * 100
-                
-                predictive_analysis.append({
-                    'date': record['date'],
-                    'sentiment': current_sentiment,
-                    'sentiment_score': record['sentiment_score'],
-                    'future_return_3d': future_return,
-                    'articles_count': record['news_articles_count']
-                })
-        
-        if not predictive_analysis:
+        # Analyze sentiment vs future returns in one vectorized pass
+        # instead of building an intermediate dict per record and then
+        # re-scanning it once per sentiment bucket plus once for the
+        # overall tally. Prices load into a float64 array (None -> NaN),
+        # the 3-day-ahead return is a single shifted subtract, and every
+        # bucket statistic is a boolean-mask reduction over that array
+        sent_codes = {'positive': 1, 'neutral': 0, 'negative': -1}
+        n = len(sentiment_history)
+        prices = np.fromiter(
+            ((r['price'] if r['price'] else np.nan) for r in sentiment_history),
+            dtype=np.float64, count=n
+        )
+        # Unknown labels code to 2: counted as predictions, in no bucket,
+        # never correct - matching the old per-record behaviour
+        sent = np.fromiter(
+            (sent_codes.get(r['sentiment'], 2) for r in sentiment_history),
+            dtype=np.int8, count=n
+        )
+
+        current = prices[:-3]
+        future = prices[3:]
+        with np.errstate(invalid='ignore'):
+            usable = ~(np.isnan(current) | np.isnan(future))
+        future_returns = (future[usable] - current[usable]) / current[usable] * 100
+        sentiments = sent[:-3][usable]
+
+        total_predictions = int(usable.sum())
+        if total_predictions == 0:
             return {"error": "Insufficient data for sentiment analysis"}
-        
-        # Calculate sentiment accuracy
-        positive_sentiment_returns = [r['future_return_3d'] for r in predictive_analysis if r['sentiment'] == 'positive']
-        negative_sentiment_returns = [r['future_return_3d'] for r in predictive_analysis if r['sentiment'] == 'negative']
-        neutral_sentiment_returns = [r['future_return_3d'] for r in predictive_analysis if r['sentiment'] == 'neutral']
-        
+
+        positive_returns = future_returns[sentiments == 1]
+        negative_returns = future_returns[sentiments == -1]
+        neutral_returns = future_returns[sentiments == 0]
+
         results = {
             'symbol': symbol,
             'analysis_period_days': days_back,
-            'total_predictions': len(predictive_analysis),
+            'total_predictions': total_predictions,
             'sentiment_breakdown': {
                 'positive': {
-                    'count': len(positive_sentiment_returns),
-                    'avg_future_return': np.mean(positive_sentiment_returns) if positive_sentiment_returns else 0,
-                    'accuracy': sum(1 for r in positive_sentiment_returns if r > 1) / len(positive_sentiment_returns) * 100 if positive_sentiment_returns else 0
+                    'count': int(positive_returns.size),
+                    'avg_future_return': float(positive_returns.mean()) if positive_returns.size else 0,
+                    'accuracy': float((positive_returns > 1).mean() * 100) if positive_returns.size else 0
                 },
                 'negative': {
-                    'count': len(negative_sentiment_returns),
-                    'avg_future_return': np.mean(negative_sentiment_returns) if negative_sentiment_returns else 0,
-                    'accuracy': sum(1 for r in negative_sentiment_returns if r < -1) / len(negative_sentiment_returns) * 100 if negative_sentiment_returns else 0
+                    'count': int(negative_returns.size),
+                    'avg_future_return': float(negative_returns.mean()) if negative_returns.size else 0,
+                    'accuracy': float((negative_returns < -1).mean() * 100) if negative_returns.size else 0
                 },
                 'neutral': {
-                    'count': len(neutral_sentiment_returns),
-                    'avg_future_return': np.mean(neutral_sentiment_returns) if neutral_sentiment_returns else 0,
-                    'accuracy': sum(1 for r in neutral_sentiment_returns if abs(r) <= 2) / len(neutral_sentiment_returns) * 100 if neutral_sentiment_returns else 0
+                    'count': int(neutral_returns.size),
+                    'avg_future_return': float(neutral_returns.mean()) if neutral_returns.size else 0,
+                    'accuracy': float((np.abs(neutral_returns) <= 2).mean() * 100) if neutral_returns.size else 0
                 }
             },
             'overall_sentiment_accuracy': 0  # Will calculate below
         }
-        
+
         # Calculate overall accuracy
-        correct_predictions = 0
-        for analysis in predictive_analysis:
-            if (analysis['sentiment'] == 'positive' and analysis['future_return_3d'] > 1) or \
-               (analysis['sentiment'] == 'negative' and analysis['future_return_3d'] < -1) or \
-               (analysis['sentiment'] == 'neutral' and abs(analysis['future_return_3d']) <= 2):
-                correct_predictions += 1
-        
-        results['overall_sentiment_accuracy'] = (correct_predictions / len(predictive_analysis) * 100) if predictive_analysis else 0
+        correct = (((sentiments == 1) & (future_returns > 1)) |
+                   ((sentiments == -1) & (future_returns < -1)) |
+                   ((sentiments == 0) & (np.abs(future_returns) <= 2)))
+        results['overall_sentiment_accuracy'] = float(correct.mean() * 100)
         
         print(f"📊 Sentiment Accuracy: {results['overall_sentiment_accuracy']:.1f}%")
         print(f"📈 Positive sentiment → Avg return: {results['sentiment_breakdown']['positive']['avg_future_return']:.2f}%")
@@ -6,6 +6,12 @@ from typing import Dict, List, Any, Optional, Union
 import pytz
 from market_scheduler import MarketScheduler
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class CacheManager:
     """
     Intelligent cache manager with timezone-aware expiration policies
@@ -246,12 +252,16 @@ class CacheManager:
         filepath = self._get_cache_filepath(data_type, cache_key)
         
         try:
-            with open(filepath, 'r') as f:
-                cached_data = json.load(f)
-            
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    cached_data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    cached_data = json.load(f)
+
             # Return only the data portion, not metadata
             return cached_data['data']
-            
+
         except Exception as e:
             print(f"Error reading cached data for {data_type}/{identifier}: {e}")
             return None
@@ -315,14 +325,65 @@ class CacheManager:
                 'kwargs': kwargs
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(cache_entry, f, indent=2, default=str)
-            
+            self._write_cache_entry(filepath, cache_entry)
+
             return True
-            
+
         except Exception as e:
             print(f"Error caching data for {data_type}/{identifier}: {e}")
             return False
+
+    def cache_data_bulk(self, data_type: str, entries: Dict[str, Any], **kwargs) -> int:
+        """
+        Cache multiple entries of the same data type in one call
+
+        Amortizes the timestamp/market-session/expiration lookups across the
+        whole batch instead of recomputing them per entry.
+
+        Args:
+            entries: Mapping of identifier -> data to cache
+
+        Returns:
+            Number of entries successfully cached
+        """
+        current_time = datetime.now(timezone.utc)
+        cached_at = current_time.isoformat()
+        market_session = self._get_current_market_session()
+        expiration_minutes = self._get_cache_expiration_minutes(data_type)
+
+        cached_count = 0
+        for identifier, data in entries.items():
+            cache_key = self._get_cache_key(data_type, identifier, **kwargs)
+            filepath = self._get_cache_filepath(data_type, cache_key)
+
+            try:
+                cache_entry = {
+                    'data': data,
+                    'cached_at': cached_at,
+                    'data_type': data_type,
+                    'identifier': identifier,
+                    'market_session_when_cached': market_session,
+                    'cache_key': cache_key,
+                    'expiration_minutes': expiration_minutes,
+                    'kwargs': kwargs
+                }
+
+                self._write_cache_entry(filepath, cache_entry)
+                cached_count += 1
+
+            except Exception as e:
+                print(f"Error caching data for {data_type}/{identifier}: {e}")
+
+        return cached_count
+
+    def _write_cache_entry(self, filepath: str, cache_entry: Dict):
+        """Serialize a cache entry to disk, using orjson when available"""
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(cache_entry, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(cache_entry, f, indent=2, default=str)
     
     def invalidate_cache(self, data_type: str = None, identifier: str = None, **kwargs) -> int:
         """Invalidate cached data. Returns number of items removed."""
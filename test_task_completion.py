@@ -58,7 +58,7 @@ def test_base_classes():
     )
     
     assert article.title == "Test Title"
-    assert len(article.content_hash) == 64  # SHA256 hash length
+    assert len(article.content_hash) == 32  # xxh3_128/blake2b digest length
     
     print("  ✓ Base classes work correctly")
 